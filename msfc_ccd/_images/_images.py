@@ -47,19 +47,35 @@ class AbstractImageData(
         the images.
         """
 
+    @property
+    def _data_loaded(self) -> na.AbstractScalar:
+        """
+        The image data, checked to be present.
+
+        Raises a :class:`ValueError` if :attr:`data` is :obj:`None`,
+        as it is for images loaded with ``load_data=False``.
+        """
+        data = self.data
+        if data is None:
+            raise ValueError(
+                f"This {type(self).__name__} has no image data, "
+                "load the images with `load_data=True` to use this member."
+            )
+        return data
+
     @property
     def num_x(self) -> int:
         """
         The number of pixels along the x-axis.
         """
-        return self.data.shape[self.axis_x]
+        return self._data_loaded.shape[self.axis_x]
 
     @property
     def num_y(self) -> int:
         """
         The number of pixels along the y-axis.
         """
-        return self.data.shape[self.axis_y]
+        return self._data_loaded.shape[self.axis_y]
 
     @property
     @abc.abstractmethod
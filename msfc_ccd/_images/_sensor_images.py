@@ -1,6 +1,10 @@
 from __future__ import annotations
 from typing_extensions import Self
 import dataclasses
+import collections.abc
+import concurrent.futures
+import functools
+import os
 import pathlib
 import numpy as np
 import astropy.units as u
@@ -15,6 +19,91 @@ __all__ = [
 ]
 
 
+def _read_fits(
+    path: str | pathlib.Path,
+    load_data: bool = True,
+) -> tuple[None | np.ndarray, astropy.io.fits.Header]:
+    """
+    Read the image and the header from the primary HDU of a FITS file.
+
+    Parameters
+    ----------
+    path
+        The FITS file to read.
+    load_data
+        If :obj:`False`, only the header is read and :obj:`None` is returned
+        in place of the image.
+    """
+    with astropy.io.fits.open(path) as hdul:
+        hdu = hdul[0]
+        if not load_data:
+            return None, hdu.header
+        return hdu.data, hdu.header
+
+
+def _read_fits_all(
+    paths: np.ndarray,
+    load_data: bool = True,
+) -> collections.abc.Iterator[tuple[None | np.ndarray, astropy.io.fits.Header]]:
+    """
+    Read a sequence of FITS files concurrently using a pool of threads,
+    yielding the results in the same order as the paths.
+
+    At most one read per worker thread is in flight at any time,
+    so no more than that many images are held in memory while waiting to be
+    consumed.
+
+    Parameters
+    ----------
+    paths
+        The FITS files to read.
+    load_data
+        If :obj:`False`, only the headers are read and :obj:`None` is yielded
+        in place of each image.
+    """
+    read = functools.partial(_read_fits, load_data=load_data)
+    max_workers = min(32, (os.cpu_count() or 1) + 4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = collections.deque()
+        for path in paths:
+            if len(futures) == max_workers:
+                yield futures.popleft().result()
+            futures.append(executor.submit(read, path))
+        while futures:
+            yield futures.popleft().result()
+
+
+def _header_array(
+    values: list,
+    path: na.AbstractScalarArray,
+    type_values: type,
+) -> na.ScalarArray:
+    """
+    Convert a list of header values, one for each FITS file, into an array
+    with the same shape as the array of paths.
+
+    Parameters
+    ----------
+    values
+        The header values of each FITS file, in the order of the flattened
+        array of paths.
+    path
+        The array of paths that the header values were read from.
+    type_values
+        The type of the header values.
+        If :obj:`object`, the values are stored unchanged, which keeps
+        strings at their full length and missing keywords as :obj:`None`.
+    """
+    if type_values is object:
+        ndarray = np.array(values, dtype=object)
+    else:
+        ndarray = np.fromiter(values, dtype=type_values, count=len(values))
+    return na.ScalarArray(
+        ndarray=ndarray.reshape(tuple(path.shape.values())),
+        axes=path.axes,
+    )
+
+
 @dataclasses.dataclass(eq=False, repr=False)
 class AbstractSensorData(
     AbstractImageData,
@@ -27,7 +116,7 @@ class AbstractSensorData(
     def pixel(self) -> dict[str, na.AbstractScalarArray]:
         axis_x = self.axis_x
         axis_y = self.axis_y
-        shape = self.data.shape
+        shape = self._data_loaded.shape
         shape_img = {
             axis_x: shape[axis_x],
             axis_y: shape[axis_y],
@@ -100,8 +189,16 @@ class SensorData(
         );
     """
 
-    data: na.AbstractScalar = dataclasses.MISSING
-    """The underlying array storing the image data."""
+    data: None | na.AbstractScalar = dataclasses.MISSING
+    """
+    The underlying array storing the image data.
+
+    This is :obj:`None` if only the FITS headers were loaded,
+    using ``load_data=False``.
+    In that case, the members which need the images, like :attr:`num_x`,
+    :attr:`num_y`, :attr:`pixel`, and :meth:`taps`,
+    raise a :class:`ValueError`.
+    """
 
     axis_x: str = dataclasses.MISSING
     """
@@ -159,24 +256,22 @@ class SensorData(
 
     @classmethod
     def _calibrate_timedelta(cls, value: int) -> u.Quantity:
-        return value * 0.000000025 * u.s
+        return (value * 0.000000025) << u.s
 
     @classmethod
     def _calibrate_voltage_fpga(cls, value: int) -> u.Quantity:
-        return value * 3 / 4096 * u.V
+        return (value * (3 / 4096)) << u.V
 
     @classmethod
     def _calibrate_temperature_fpga(cls, value: int) -> u.Quantity:
-        result = value * 503.975 / 4096 * u.K
-        result = result.to(u.deg_C, equivalencies=u.temperature())
-        return result
+        result = value * (503.975 / 4096) - 273.15
+        return result << u.deg_C
 
     @classmethod
     def _calibrate_temperature_adc_1(cls, value: int) -> u.Quantity:
         r = (9.814453125 * value) / (1 - (value / 4096.0))
-        result = 3455.0 / np.log(r / 0.0927557) * u.K
-        result = result.to(u.deg_C, equivalencies=u.temperature())
-        return result
+        result = 3455.0 / np.log(r / 0.0927557) - 273.15
+        return result << u.deg_C
 
     @classmethod
     def _calibrate_temperature_adc_234(cls, value: int) -> u.Quantity:
@@ -184,9 +279,9 @@ class SensorData(
         a = 0.0011275
         b = 0.00023441
         c = 0.000000086482
-        result = 1 / (a + (b * np.log(r)) + (c * np.log(r)) ** 3) * u.K
-        result = result.to(u.deg_C, equivalencies=u.temperature())
-        return result
+        log_r = np.log(r)
+        result = 1 / (a + (b * log_r) + (c * log_r) ** 3) - 273.15
+        return result << u.deg_C
 
     @classmethod
     def from_fits(
@@ -194,6 +289,8 @@ class SensorData(
         path: str | pathlib.Path | na.AbstractScalarArray,
         axis_x: str = "detector_x",
         axis_y: str = "detector_y",
+        dtype: str | type | np.dtype = int,
+        load_data: bool = True,
     ) -> Self:
         """
         Load an image or an array of images from a FITS file or an array of
@@ -210,59 +307,105 @@ class SensorData(
         axis_y
             The name of the logical axis representing the vertical dimension of
             the images.
+        dtype
+            The data type of the loaded images.
+            The default, :class:`int`, is a signed integer, so arithmetic on the images,
+            like subtracting a bias, cannot wrap around.
+            If ``"native"``, the smallest data type which can represent the images
+            in all the FITS files is used, which is usually a 16-bit integer.
+            This uses less memory, but arithmetic on unsigned images will wrap
+            around unless they are converted first.
+        load_data
+            If :obj:`False`, only the FITS headers are read and
+            :attr:`data` is set to :obj:`None`.
+            This is much faster if only the image metadata is needed,
+            but the members which need the images, like :attr:`num_x`,
+            :attr:`num_y`, :attr:`pixel`, and :meth:`taps`, then raise a
+            :class:`ValueError`.
         """
 
         path = na.as_named_array(path)
 
-        time = np.zeros_like(path, dtype=float)
-        time.ndarray = astropy.time.Time(time.ndarray, format="jd")
+        shape = tuple(path.shape.values())
+
+        keys_required = (
+            "IMG_TS",
+            "MEAS_EXP",
+            "IMG_EXP",
+            "FPGAVINT",
+            "FPGAVAUX",
+            "FPGAVBRM",
+            "FPGATEMP",
+            "ADCTEMP1",
+            "ADCTEMP2",
+            "ADCTEMP3",
+            "ADCTEMP4",
+        )
+        keys_optional = (
+            "CAM_SN",
+            "RUN_MODE",
+            "IMG_STAT",
+        )
+        header_values = {key: [] for key in keys_required + keys_optional}
+
+        indices = tuple(path.ndindex())
+        paths = np.ravel(path.ndarray)
+
+        native = isinstance(dtype, str) and dtype == "native"
+
+        data = None
 
-        timedelta = np.empty_like(path, dtype=np.int64)
-        timedelta_requested = np.empty_like(path, dtype=float) << u.s
-        serial_number = np.empty_like(path, dtype=str)
-        run_mode = np.empty_like(path, dtype=str)
-        status = np.empty_like(path, dtype=str)
-        voltage_fpga_vccint = np.empty_like(path, dtype=int)
-        voltage_fpga_vccaux = np.empty_like(path, dtype=int)
-        voltage_fpga_vccbram = np.empty_like(path, dtype=int)
-        temperature_fpga = np.empty_like(path, dtype=int)
-        temperature_adc_1 = np.empty_like(path, dtype=int)
-        temperature_adc_2 = np.empty_like(path, dtype=int)
-        temperature_adc_3 = np.empty_like(path, dtype=int)
-        temperature_adc_4 = np.empty_like(path, dtype=int)
+        results = _read_fits_all(paths, load_data=load_data)
 
-        for i, index in enumerate(path.ndindex()):
+        for index, (data_index, header) in zip(indices, results):
 
-            hdu = astropy.io.fits.open(path[index].ndarray)[0]
+            for key in keys_required:
+                header_values[key].append(header[key])
+            for key in keys_optional:
+                header_values[key].append(header.get(key))
+
+            if not load_data:
+                continue
 
             data_index = na.ScalarArray(
-                ndarray=hdu.data,
+                ndarray=data_index,
                 axes=(axis_y, axis_x),
             )
 
-            if i == 0:
+            if data is None:
+                if native:
+                    dtype_data = data_index.dtype.newbyteorder("=")
+                else:
+                    dtype_data = dtype
                 data = na.ScalarArray.empty(
                     shape=na.broadcast_shapes(path.shape, data_index.shape),
-                    dtype=int,
+                    dtype=dtype_data,
                 )
+            elif native and not np.can_cast(data_index.dtype, data.dtype):
+                data = data.astype(np.promote_types(data.dtype, data_index.dtype))
 
             data[index] = data_index
 
-            header = hdu.header
-            time[index] = astropy.time.Time(header["IMG_TS"])
-            timedelta[index] = header["MEAS_EXP"]
-            timedelta_requested[index] = header["IMG_EXP"] * u.ms
-            serial_number[index] = header.get("CAM_SN")
-            run_mode[index] = header.get("RUN_MODE")
-            status[index] = header.get("IMG_STAT")
-            voltage_fpga_vccint[index] = header["FPGAVINT"]
-            voltage_fpga_vccaux[index] = header["FPGAVAUX"]
-            voltage_fpga_vccbram[index] = header["FPGAVBRM"]
-            temperature_fpga[index] = header["FPGATEMP"]
-            temperature_adc_1[index] = header["ADCTEMP1"]
-            temperature_adc_2[index] = header["ADCTEMP2"]
-            temperature_adc_3[index] = header["ADCTEMP3"]
-            temperature_adc_4[index] = header["ADCTEMP4"]
+        time = astropy.time.Time(header_values["IMG_TS"])
+        time.format = "jd"
+        time = na.ScalarArray(
+            ndarray=time.reshape(shape),
+            axes=path.axes,
+        )
+        timedelta = _header_array(header_values["MEAS_EXP"], path, np.int64)
+        timedelta_requested = _header_array(header_values["IMG_EXP"], path, float)
+        timedelta_requested = (timedelta_requested * u.ms).to(u.s)
+        serial_number = _header_array(header_values["CAM_SN"], path, object)
+        run_mode = _header_array(header_values["RUN_MODE"], path, object)
+        status = _header_array(header_values["IMG_STAT"], path, object)
+        voltage_fpga_vccint = _header_array(header_values["FPGAVINT"], path, int)
+        voltage_fpga_vccaux = _header_array(header_values["FPGAVAUX"], path, int)
+        voltage_fpga_vccbram = _header_array(header_values["FPGAVBRM"], path, int)
+        temperature_fpga = _header_array(header_values["FPGATEMP"], path, int)
+        temperature_adc_1 = _header_array(header_values["ADCTEMP1"], path, int)
+        temperature_adc_2 = _header_array(header_values["ADCTEMP2"], path, int)
+        temperature_adc_3 = _header_array(header_values["ADCTEMP3"], path, int)
+        temperature_adc_4 = _header_array(header_values["ADCTEMP4"], path, int)
 
         timedelta = cls._calibrate_timedelta(timedelta)
         voltage_fpga_vccint = cls._calibrate_voltage_fpga(voltage_fpga_vccint)
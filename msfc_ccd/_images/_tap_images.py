@@ -208,19 +208,27 @@ class TapData(
             variation of the tap index.
         """
 
+        data = a._data_loaded
+
         axis_x = a.axis_x
         axis_y = a.axis_y
 
-        num_x = a.num_x
-        num_y = a.num_y
+        shape = data.shape
+
+        num_x = shape[axis_x]
+        num_y = shape[axis_y]
 
         num_tap_x = cls.num_tap_x
         num_tap_y = cls.num_tap_y
 
-        shape_img = {axis_x: num_x, axis_y: num_y}
+        num_x_new, remainder_x = divmod(num_x, num_tap_x)
+        num_y_new, remainder_y = divmod(num_y, num_tap_y)
 
-        num_x_new = num_x // num_tap_x
-        num_y_new = num_y // num_tap_y
+        if remainder_x or remainder_y:
+            raise ValueError(
+                f"The image shape, {num_x} x {num_y}, cannot be evenly divided "
+                f"into {num_tap_x} x {num_tap_y} taps."
+            )
 
         slice_left_x = slice(None, num_x_new)
         slice_left_y = slice(None, num_y_new)
@@ -231,26 +239,37 @@ class TapData(
         slices_x = [slice_left_x, slice_right_x]
         slices_y = [slice_left_y, slice_right_y]
 
-        pixel = a.pixel
-
-        for ax in pixel:
-            p = pixel[ax].broadcast_to(shape_img)
-            pixel[ax] = na.stack(
-                arrays=[
-                    na.stack(
-                        arrays=[p[{axis_x: sx, axis_y: sy}] for sy in slices_y],
-                        axis=axis_tap_y,
-                    )
-                    for sx in slices_x
-                ],
-                axis=axis_tap_x,
-            )
+        data_taps = na.stack(
+            arrays=[
+                na.stack(
+                    arrays=[data[{axis_x: sx, axis_y: sy}] for sy in slices_y],
+                    axis=axis_tap_y,
+                )
+                for sx in slices_x
+            ],
+            axis=axis_tap_x,
+        )
+
+        pixel = dict()
+
+        for ax, p in a.pixel.items():
+            if axis_y in p.shape:
+                p = na.stack(
+                    arrays=[p[{axis_y: sy}] for sy in slices_y],
+                    axis=axis_tap_y,
+                )
+            if axis_x in p.shape:
+                p = na.stack(
+                    arrays=[p[{axis_x: sx}] for sx in slices_x],
+                    axis=axis_tap_x,
+                )
+            pixel[ax] = p
 
         return cls(
-            data=a.data[pixel],
+            data=data_taps,
             pixel=pixel,
-            axis_x=a.axis_x,
-            axis_y=a.axis_y,
+            axis_x=axis_x,
+            axis_y=axis_y,
             axis_tap_x=axis_tap_x,
             axis_tap_y=axis_tap_y,
             time=a.time,
@@ -6,14 +6,51 @@ import named_arrays as na
 import msfc_ccd
 from . import test_images
 
+_time_start = astropy.time.Time("2024-03-25T20:49")
+_time_stop = astropy.time.Time("2024-03-25T21:49")
+
 
 class AbstractTestAbstractSensorData(
     test_images.AbstractTestAbstractImageData,
 ):
     def test_taps(self, a: msfc_ccd.abc.AbstractSensorData):
-        result = a.taps()
+        axis_x = a.axis_x
+        axis_y = a.axis_y
+        axis_tap_x = "tap_x"
+        axis_tap_y = "tap_y"
+        num_x = a.num_x
+        num_y = a.num_y
+        result = a.taps(axis_tap_x, axis_tap_y)
         assert isinstance(result, msfc_ccd.TapData)
 
+        assert np.all(result.data == a.data[result.pixel])
+
+        for ax in result.pixel:
+            shape = na.broadcast_shapes(result.pixel[ax].shape, result.data.shape)
+            assert shape == result.data.shape
+
+        index_00 = {axis_tap_x: 0, axis_tap_y: 0, axis_x: 0, axis_y: 0}
+        index_11 = {axis_tap_x: 1, axis_tap_y: 1, axis_x: 0, axis_y: 0}
+        assert np.all(result.data[index_00] == a.data[{axis_x: 0, axis_y: 0}])
+        assert np.all(result.data[index_11] == a.data[{axis_x: -1, axis_y: -1}])
+
+        pixel_x = result.pixel[axis_x]
+        pixel_y = result.pixel[axis_y]
+        num_x_tap = num_x // 2
+        num_y_tap = num_y // 2
+        x_left = na.arange(0, num_x_tap, axis=axis_x)
+        x_right = na.arange(num_x - 1, num_x_tap - 1, axis=axis_x, step=-1)
+        y_lower = na.arange(0, num_y_tap, axis=axis_y)
+        y_upper = na.arange(num_y - 1, num_y_tap - 1, axis=axis_y, step=-1)
+        assert np.all(pixel_x[{axis_tap_x: 0}] == x_left)
+        assert np.all(pixel_x[{axis_tap_x: 1}] == x_right)
+        assert np.all(pixel_y[{axis_tap_y: 0}] == y_lower)
+        assert np.all(pixel_y[{axis_tap_y: 1}] == y_upper)
+
+        axes_tap = (axis_tap_x, axis_tap_y, axis_x, axis_y)
+        axes_img = (axis_x, axis_y)
+        assert np.allclose(result.data.sum(axes_tap), a.data.sum(axes_img))
+
 
 @pytest.mark.parametrize(
     argnames="a",
@@ -22,7 +59,7 @@ class AbstractTestAbstractSensorData(
             data=na.random.uniform(0, 1, shape_random=dict(x=22, y=12)),
             axis_x="x",
             axis_y="y",
-            time=astropy.time.Time("2024-03-25T20:49"),
+            time=_time_start,
             timedelta=9.98 * u.s,
             timedelta_requested=10 * u.s,
             serial_number="SN-001",
@@ -46,11 +83,7 @@ class AbstractTestAbstractSensorData(
             axis_x="x",
             axis_y="y",
             time=na.ScalarArray(
-                ndarray=np.linspace(
-                    astropy.time.Time("2024-03-25T20:49"),
-                    astropy.time.Time("2024-03-25T21:49"),
-                    num=5,
-                ),
+                ndarray=np.linspace(_time_start, _time_stop, num=5),
                 axes="t",
             ),
             timedelta=na.ScalarArray(
@@ -70,6 +103,32 @@ class AbstractTestAbstractSensorData(
             temperature_adc_3=23 * u.deg_C,
             temperature_adc_4=24 * u.deg_C,
         ),
+        msfc_ccd.SensorData(
+            data=na.random.uniform(
+                low=0 * u.DN,
+                high=1000 * u.DN,
+                shape_random=dict(t=5, x=22, y=12),
+            ),
+            axis_x="x",
+            axis_y="y",
+            time=na.ScalarArray(
+                ndarray=np.linspace(_time_start, _time_stop, num=5),
+                axes="t",
+            ),
+            timedelta=10 * u.s,
+            timedelta_requested=10 * u.s,
+            serial_number="SN-001",
+            run_mode="sequence",
+            status="completed",
+            voltage_fpga_vccint=5 * u.V,
+            voltage_fpga_vccaux=6 * u.V,
+            voltage_fpga_vccbram=7 * u.V,
+            temperature_fpga=20 * u.deg_C,
+            temperature_adc_1=21 * u.deg_C,
+            temperature_adc_2=22 * u.deg_C,
+            temperature_adc_3=23 * u.deg_C,
+            temperature_adc_4=24 * u.deg_C,
+        ),
         msfc_ccd.SensorData.from_fits(
             path=msfc_ccd.samples.path_fe55_esis1,
         ),
@@ -1,4 +1,6 @@
 import pytest
+import dataclasses
+import numpy as np
 import named_arrays as na
 import msfc_ccd
 from . import test_images
@@ -36,3 +38,35 @@ class TestTapImage(
     AbstractTestAbstractTapImage,
 ):
     pass
+
+
+def test_from_sensor_data_uneven():
+    a = msfc_ccd.fits.open(msfc_ccd.samples.path_fe55_esis1)
+    a.data = a.data[{a.axis_x: slice(None, -1)}]
+    with pytest.raises(ValueError):
+        msfc_ccd.TapData.from_sensor_data(a)
+
+
+def test_from_sensor_data_uncertain():
+    a = msfc_ccd.fits.open(msfc_ccd.samples.path_fe55_esis1)
+    data = a.data
+    a.data = na.UncertainScalarArray(data, data // 10)
+    result = msfc_ccd.TapData.from_sensor_data(a)
+    assert isinstance(result.data, na.UncertainScalarArray)
+    assert np.all(result.data.nominal == data[result.pixel])
+    assert np.all(result.data.distribution == (data // 10)[result.pixel])
+
+
+def test_from_sensor_data_pixel():
+    class _SensorDataOffset(msfc_ccd.SensorData):
+        @property
+        def pixel(self) -> dict[str, na.AbstractScalarArray]:
+            pixel = super().pixel
+            return {ax: pixel[ax] + 0.5 for ax in pixel}
+
+    a = msfc_ccd.fits.open(msfc_ccd.samples.path_fe55_esis1)
+    b = _SensorDataOffset(**{f.name: getattr(a, f.name) for f in dataclasses.fields(a)})
+    result = msfc_ccd.TapData.from_sensor_data(b)
+    expected = msfc_ccd.TapData.from_sensor_data(a)
+    for ax in expected.pixel:
+        assert np.all(result.pixel[ax] == expected.pixel[ax] + 0.5)
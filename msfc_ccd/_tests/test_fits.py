@@ -1,6 +1,7 @@
 import pytest
 import pathlib
 import numpy as np
+import astropy.io.fits
 import named_arrays as na
 import msfc_ccd
 
@@ -24,3 +25,64 @@ def test_open(path: str | pathlib.Path | na.AbstractScalarArray):
     result = msfc_ccd.fits.open(path)
     assert isinstance(result, msfc_ccd.SensorData)
     assert result.data.sum() != 0
+    assert result.time.ndarray.format == "jd"
+
+
+@pytest.mark.parametrize(
+    argnames="dtype",
+    argvalues=[
+        "native",
+        np.float32,
+    ],
+)
+def test_open_dtype(dtype: str | type):
+    result = msfc_ccd.fits.open(msfc_ccd.samples.path_fe55_esis1, dtype=dtype)
+    if dtype == "native":
+        assert np.issubdtype(result.data.dtype, np.integer)
+    else:
+        assert result.data.dtype == dtype
+
+
+def test_open_dtype_default():
+    result = msfc_ccd.fits.open(msfc_ccd.samples.path_fe55_esis1)
+    data = result.data
+    assert data.dtype == np.dtype(int)
+    assert np.all(data - (data.max() + 1) < 0)
+    assert np.all(data**2 >= data)
+
+
+def test_open_dtype_native_mixed(tmp_path: pathlib.Path):
+    header = astropy.io.fits.getheader(msfc_ccd.samples.path_fe55_esis1)
+    header.remove("BZERO", ignore_missing=True)
+    header.remove("BSCALE", ignore_missing=True)
+    dtypes = [np.int16, np.uint16]
+    paths = []
+    for dtype in dtypes:
+        path = tmp_path / f"{np.dtype(dtype).name}.fit"
+        data = np.full((4, 6), np.iinfo(dtype).max, dtype=dtype)
+        astropy.io.fits.PrimaryHDU(data=data, header=header).writeto(path)
+        paths.append(str(path))
+    path = na.ScalarArray(np.array(paths), axes="time")
+    result = msfc_ccd.fits.open(path, dtype="native")
+    assert result.data.dtype == np.promote_types(*dtypes)
+    for i, dtype in enumerate(dtypes):
+        assert np.all(result.data[dict(time=i)] == np.iinfo(dtype).max)
+
+
+def test_open_headers_only():
+    result = msfc_ccd.fits.open(msfc_ccd.samples.path_fe55_esis1, load_data=False)
+    expected = msfc_ccd.fits.open(msfc_ccd.samples.path_fe55_esis1)
+    assert result.data is None
+    assert np.all(result.time == expected.time)
+    assert np.all(result.temperature_adc_1 == expected.temperature_adc_1)
+    with pytest.raises(ValueError, match="no image data"):
+        _ = result.num_x
+    with pytest.raises(ValueError, match="no image data"):
+        result.taps()
+
+
+def test_open_serial_number():
+    path = msfc_ccd.samples.path_fe55_esis1
+    result = msfc_ccd.fits.open(path)
+    expected = astropy.io.fits.getheader(path).get("CAM_SN")
+    assert result.serial_number.ndarray == expected
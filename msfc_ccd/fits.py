@@ -3,6 +3,7 @@ Utilities for working with FITS files.
 """
 
 import pathlib
+import numpy as np
 import named_arrays as na
 import msfc_ccd
 
@@ -16,6 +17,8 @@ def open(
     path: str | pathlib.Path | na.AbstractScalarArray,
     axis_x: str = "detector_x",
     axis_y: str = "detector_y",
+    dtype: str | type | np.dtype = int,
+    load_data: bool = True,
 ) -> msfc_ccd.SensorData:
     """
     Load an image from a given FITS file path, or an array of images from
@@ -34,6 +37,22 @@ def open(
     axis_y
         The name of the logical axis representing the vertical dimension of
         the images.
+    dtype
+        The data type of the loaded images.
+        The default, :class:`int`, is a signed integer, so arithmetic on the images,
+        like subtracting a bias, cannot wrap around.
+        If ``"native"``, the smallest data type which can represent the images
+        in all the FITS files is used, which is usually a 16-bit integer.
+        This uses less memory, but arithmetic on unsigned images will wrap
+        around unless they are converted first.
+    load_data
+        If :obj:`False`, only the FITS headers are read and
+        :attr:`msfc_ccd.SensorData.data` is set to :obj:`None`.
+        This is much faster if only the image metadata is needed,
+        but the members which need the images, like
+        :attr:`~msfc_ccd.SensorData.num_x`, :attr:`~msfc_ccd.SensorData.num_y`,
+        :attr:`~msfc_ccd.SensorData.pixel`, and
+        :meth:`~msfc_ccd.SensorData.taps`, then raise a :class:`ValueError`.
 
     Examples
     --------
@@ -119,4 +138,6 @@ def open(
         path=path,
         axis_x=axis_x,
         axis_y=axis_y,
+        dtype=dtype,
+        load_data=load_data,
     )